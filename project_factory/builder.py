@@ -1,27 +1,140 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
-
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
 
 from .config import CreateCommandConfig, Plan
 from .ollama_client import OllamaClient
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+# Static per-project files, kept as bytes so they are written without re-encoding.
+_GITIGNORE_BYTES = (
+    b"# Project-local ignores\n"
+    # No trailing slash: .venv may be a symlink to a shared venv
+    b".venv\n"
+    b"__pycache__/\n"
+    b".pytest_cache/\n"
+    b"*.log\n"
+    b"data/\n"
+    b"models/\n"
+    b"model_dumps/\n"
+    b".env\n"
+    b".DS_Store\n"
+)
+
+_PRE_COMMIT_CONFIG_BYTES = (
+    b"repos:\n"
+    b"  - repo: https://github.com/psf/black\n"
+    b"    rev: 24.4.2\n"
+    b"    hooks:\n"
+    b"      - id: black\n"
+    b"        language_version: python3\n"
+    b"\n"
+    b"  - repo: https://github.com/pycqa/isort\n"
+    b"    rev: 5.13.2\n"
+    b"    hooks:\n"
+    b"      - id: isort\n"
+    b"        args: [\"--profile\", \"black\"]\n"
+    b"\n"
+    b"  - repo: https://github.com/pre-commit/pre-commit-hooks\n"
+    b"    rev: v4.6.0\n"
+    b"    hooks:\n"
+    b"      - id: check-yaml\n"
+    b"      - id: end-of-file-fixer\n"
+    b"      - id: trailing-whitespace\n"
+    b"\n"
+    b"  - repo: https://github.com/gitleaks/gitleaks\n"
+    b"    rev: v8.18.2\n"
+    b"    hooks:\n"
+    b"      - id: gitleaks\n"
+    b"        args: [\"protect\", \"--staged\", \"--config=.gitleaks.toml\"]\n"
+)
+
+_GITLEAKS_CONFIG_BYTES = (
+    b"title = \"Project Factory gitleaks config\"\n"
+    b"\n"
+    b"[allowlist]\n"
+    b"description = \"Allow some common test secrets\"\n"
+    b"regexes = [\n"
+    b"  '''dummysecret''',\n"
+    b"  '''example_key''',\n"
+    b"]\n"
+    b"\n"
+    b"[[rules]]\n"
+    b"id = \"generic-api-key\"\n"
+    b"description = \"Generic API Key\"\n"
+    b"regex = '''(?i)(api[_-]?key|token)[^a-zA-Z0-9]?[\\'\\\"]?[0-9a-zA-Z\\-_=]{16,}'''\n"
+    b"tags = [\"key\", \"api\", \"generic\"]\n"
+    b"\n"
+    b"[[rules]]\n"
+    b"id = \"private-key\"\n"
+    b"description = \"Private key block\"\n"
+    b"regex = '''-----BEGIN (RSA |EC |DSA )?PRIVATE KEY-----'''\n"
+    b"tags = [\"key\", \"private\", \"pem\"]\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(template_dir: str) -> Environment:
+    """
+    Return the shared Jinja environment for a template directory.
+
+    Templates ship with the package and do not change while the process runs,
+    so reload checks are disabled and compiled templates are never evicted.
+    """
+    # Imported lazily so dry runs and --help do not pay for loading jinja2
+    from jinja2 import Environment, FileSystemLoader, StrictUndefined
+
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        undefined=StrictUndefined,
+        autoescape=False,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+# Jinja-based files rendered for every template, relative to the template dir
+_JINJA_FILES: Tuple[str, ...] = (
+    "README.md.j2",
+    "pyproject.toml.j2",
+    "app/main.py.j2",
+    "app/routers/health.py.j2",
+    "tests/test_smoke.py.j2",
+)
+
+
+def _output_rel(rel: str) -> str:
+    return rel[:-3] if rel.endswith(".j2") else rel
+
 
 class Builder:
     def __init__(self, templates_root: Path, ollama: OllamaClient) -> None:
         self.templates_root = templates_root
         self.ollama = ollama
+        # Compiled (output rel path, template) pairs per template dir, filled on first build
+        self._compiled: Dict[str, List[Tuple[str, Template]]] = {}
 
-    def _make_jinja_env(self, template_dir: Path) -> Environment:
-        return Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            undefined=StrictUndefined,
-            autoescape=False,
-            keep_trailing_newline=True,
-        )
+    def _compiled_templates(self, template_dir: Path) -> List[Tuple[str, Template]]:
+        key = str(template_dir)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            env = _get_env(key)
+            compiled = []
+            for rel in _JINJA_FILES:
+                src = template_dir / rel
+                if not src.is_file():
+                    raise FileNotFoundError(f"Template file not found: {src}")
+                compiled.append((_output_rel(rel), env.get_template(rel)))
+            self._compiled[key] = compiled
+        return compiled
 
     def build(self, cfg: CreateCommandConfig, plan: Plan, dry_run: bool) -> None:
         """
@@ -44,34 +157,29 @@ class Builder:
         }
         context.update(template_meta.get("defaults", {}))
 
-        env = self._make_jinja_env(template_dir)
         project_root = cfg.project_root
-
-        # Jinja-based files
-        jinja_files = [
-            "README.md.j2",
-            "pyproject.toml.j2",
-            "app/main.py.j2",
-            "app/routers/health.py.j2",
-            "tests/test_smoke.py.j2",
-        ]
+        project_root_str = cfg.project_root_str
 
         print(f"[Builder] Target project root: {project_root}")
-        for rel in jinja_files:
-            src = template_dir / rel
-            if not src.is_file():
-                raise FileNotFoundError(f"Template file not found: {src}")
-
-            rel_out = rel[:-3] if rel.endswith(".j2") else rel
-            dest = project_root / rel_out
-            if dry_run:
+        renders: List[Tuple[Path, bytes]] = []
+        if dry_run:
+            for rel in _JINJA_FILES:
+                src = template_dir / rel
+                if not src.is_file():
+                    raise FileNotFoundError(f"Template file not found: {src}")
+                dest = Path(os.path.join(project_root_str, _output_rel(rel)))
                 print(f"[Builder/DRY_RUN] Would render {src} -> {dest}")
-                continue
+        else:
+            for rel_out, template in self._compiled_templates(template_dir):
+                dest = Path(os.path.join(project_root_str, rel_out))
+                rendered = template.render(**context)
+                renders.append((dest, rendered.encode("utf8")))
 
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            template = env.get_template(rel)
-            rendered = template.render(**context)
-            dest.write_text(rendered, encoding="utf8")
+        # Render everything first, then create directories and write in one pass
+        for parent in sorted({dest.parent for dest, _ in renders}):
+            parent.mkdir(parents=True, exist_ok=True)
+        for dest, data in renders:
+            self._write_bytes(dest, data)
             print(f"[Builder] Rendered {dest}")
 
         # Ensure per-project gitignore and repo-level safety configs
@@ -83,29 +191,28 @@ class Builder:
         if not dry_run and readme_path.is_file():
             self._post_process_readme(cfg, readme_path)
 
+    @staticmethod
+    def _write_bytes(dest: Path, data: bytes) -> None:
+        fd = os.open(str(dest), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
     def _ensure_project_gitignore(self, cfg: CreateCommandConfig, dry_run: bool) -> None:
-        content = (
-            "# Project-local ignores\n"
-            ".venv/\n"
-            "__pycache__/\n"
-            ".pytest_cache/\n"
-            "*.log\n"
-            "data/\n"
-            "models/\n"
-            "model_dumps/\n"
-            ".env\n"
-            ".DS_Store\n"
-        )
         if dry_run:
             print(f"[Builder/DRY_RUN] Would ensure project .gitignore at {cfg.project_gitignore}")
             return
         cfg.project_gitignore.parent.mkdir(parents=True, exist_ok=True)
         if cfg.project_gitignore.exists():
-            existing = cfg.project_gitignore.read_text(encoding="utf8")
-            if content.strip() not in existing:
-                cfg.project_gitignore.write_text(existing.rstrip() + "\n\n" + content, encoding="utf8")
+            existing = cfg.project_gitignore.read_bytes()
+            if _GITIGNORE_BYTES.strip() not in existing:
+                cfg.project_gitignore.write_bytes(existing.rstrip() + b"\n\n" + _GITIGNORE_BYTES)
         else:
-            cfg.project_gitignore.write_text(content, encoding="utf8")
+            cfg.project_gitignore.write_bytes(_GITIGNORE_BYTES)
         print(f"[Builder] Ensured .gitignore at {cfg.project_gitignore}")
 
     def _ensure_project_repo_configs(self, cfg: CreateCommandConfig, dry_run: bool) -> None:
@@ -117,66 +224,15 @@ class Builder:
         pre_commit_path = project_root / ".pre-commit-config.yaml"
         gitleaks_path = project_root / ".gitleaks.toml"
 
-        pre_commit_content = (
-            "repos:\n"
-            "  - repo: https://github.com/psf/black\n"
-            "    rev: 24.4.2\n"
-            "    hooks:\n"
-            "      - id: black\n"
-            "        language_version: python3\n"
-            "\n"
-            "  - repo: https://github.com/pycqa/isort\n"
-            "    rev: 5.13.2\n"
-            "    hooks:\n"
-            "      - id: isort\n"
-            "        args: [\"--profile\", \"black\"]\n"
-            "\n"
-            "  - repo: https://github.com/pre-commit/pre-commit-hooks\n"
-            "    rev: v4.6.0\n"
-            "    hooks:\n"
-            "      - id: check-yaml\n"
-            "      - id: end-of-file-fixer\n"
-            "      - id: trailing-whitespace\n"
-            "\n"
-            "  - repo: https://github.com/gitleaks/gitleaks\n"
-            "    rev: v8.18.2\n"
-            "    hooks:\n"
-            "      - id: gitleaks\n"
-            "        args: [\"protect\", \"--staged\", \"--config=.gitleaks.toml\"]\n"
-        )
-
-        gitleaks_content = (
-            "title = \"Project Factory gitleaks config\"\n"
-            "\n"
-            "[allowlist]\n"
-            "description = \"Allow some common test secrets\"\n"
-            "regexes = [\n"
-            "  '''dummysecret''',\n"
-            "  '''example_key''',\n"
-            "]\n"
-            "\n"
-            "[[rules]]\n"
-            "id = \"generic-api-key\"\n"
-            "description = \"Generic API Key\"\n"
-            "regex = '''(?i)(api[_-]?key|token)[^a-zA-Z0-9]?[\\'\\\"]?[0-9a-zA-Z\\-_=]{16,}'''\n"
-            "tags = [\"key\", \"api\", \"generic\"]\n"
-            "\n"
-            "[[rules]]\n"
-            "id = \"private-key\"\n"
-            "description = \"Private key block\"\n"
-            "regex = '''-----BEGIN (RSA |EC |DSA )?PRIVATE KEY-----'''\n"
-            "tags = [\"key\", \"private\", \"pem\"]\n"
-        )
-
         if dry_run:
             print(f"[Builder/DRY_RUN] Would ensure .pre-commit-config.yaml and .gitleaks.toml in {project_root}")
             return
 
         if not pre_commit_path.exists():
-            pre_commit_path.write_text(pre_commit_content, encoding="utf8")
+            pre_commit_path.write_bytes(_PRE_COMMIT_CONFIG_BYTES)
             print(f"[Builder] Created {pre_commit_path}")
         if not gitleaks_path.exists():
-            gitleaks_path.write_text(gitleaks_content, encoding="utf8")
+            gitleaks_path.write_bytes(_GITLEAKS_CONFIG_BYTES)
             print(f"[Builder] Created {gitleaks_path}")
 
     def _post_process_readme(self, cfg: CreateCommandConfig, readme_path: Path) -> None:
@@ -195,7 +251,7 @@ class Builder:
             "the purpose and endpoints clearly in concise, production-friendly language."
         )
         try:
-            updated = self.ollama.generate(model=cfg.ollama_model, prompt=prompt)
+            updated = "".join(self.ollama.stream(model=cfg.ollama_model, prompt=prompt))
         except Exception as exc:  # noqa: BLE001
             print(f"[Builder] Ollama README customization failed ({exc}), keeping original README.")
             return
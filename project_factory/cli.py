@@ -84,8 +84,9 @@ def run_create(
 
     planner = Planner()
     ollama = OllamaClient()
-    builder = Builder(templates_root=Path(__file__).resolve().parent / "templates", ollama=ollama)
-    verifier = Verifier()
+    templates_root = Path(__file__).resolve().parent / "templates"
+    builder = Builder(templates_root=templates_root, ollama=ollama)
+    verifier = Verifier(templates_root=templates_root)
     safety = SafetyScanner()
     committer = Committer(safety=safety)
 
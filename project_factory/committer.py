@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Iterable, List
@@ -25,6 +26,11 @@ class Committer:
         """
         project_root = cfg.project_root
         repo_root = project_root
+        # String prefix test is much cheaper than walking Path.parents per file
+        project_str = cfg.project_root_str
+        project_prefix = project_str + os.sep
+        # Encoded once and reused as cwd for every git invocation
+        cwd = os.fsencode(repo_root)
 
         print(f"[Committer] Repo root: {repo_root}")
         print(f"[Committer] Project root: {project_root}")
@@ -32,103 +38,135 @@ class Committer:
         # Ensure the project has its own git repo
         if not dry_run and not (repo_root / ".git").exists():
             print(f"[Committer] Initializing new git repository in {repo_root}")
-            self._git_init(repo_root)
+            self._git_init(cwd)
 
         if dry_run:
             print("[Committer/DRY_RUN] Would execute the following commits:")
             for step in plan.commits:
-                rel_paths = [str(p.relative_to(repo_root)) for p in self._resolve_paths(step.include_paths)]
+                rel_paths = [os.path.relpath(p, repo_root) for p in self._resolve_paths(cwd, step.include_paths)]
                 print(f" - {step.message}: {rel_paths}")
             return
 
+        # Files can change between runs; only reuse scan results within this one
+        self.safety.clear_cache()
         for step in plan.commits:
-            include_paths = self._resolve_paths(step.include_paths)
-            include_paths = [p for p in include_paths if project_root in p.parents or p == project_root]
+            include_paths = self._resolve_paths(cwd, step.include_paths)
+            include_paths = [p for p in include_paths if (s := str(p)) == project_str or s.startswith(project_prefix)]
             if not include_paths:
                 print(f"[Committer] No files to include for commit step {step.name}, skipping.")
                 continue
 
             print(f"[Committer] Preparing commit '{step.message}'")
-            self._git_add(repo_root, include_paths)
+            self._git_add(cwd, include_paths)
 
             # Safety check staged files (limited to project)
-            staged = self._get_staged_paths(repo_root)
-            staged_in_project = [p for p in staged if project_root in p.parents or p == project_root]
+            staged = self._get_staged_paths(cwd)
+            staged_in_project = [p for p in staged if (s := str(p)) == project_str or s.startswith(project_prefix)]
             issues = self.safety.scan_paths(staged_in_project)
             if issues:
                 self.safety.print_issues(issues)
                 # Reset staged changes for safety
-                self._git_reset(repo_root, staged_in_project)
+                self._git_reset(cwd, staged_in_project)
                 raise CommitterError("Aborting commit due to potential secrets in staged files.")
 
-            self._git_commit(repo_root, step.message)
+            self._git_commit(cwd, step.message)
         print("[Committer] All planned commits completed.")
 
     @staticmethod
-    def _resolve_paths(paths: Iterable[Path]) -> List[Path]:
-        result: List[Path] = []
+    def _resolve_paths(cwd: bytes, paths: Iterable[Path]) -> List[Path]:
+        """
+        Expand include paths into the files git would stage.
+
+        Directories are expanded via `git ls-files` (modified and untracked,
+        honoring .gitignore) instead of walking the tree, so ignored content
+        such as .venv/ or __pycache__/ is never visited. Before `git init`
+        (dry runs) directories are walked instead.
+        """
+        root = os.fsdecode(cwd)
+        have_repo = os.path.exists(os.path.join(root, ".git"))
+        result: List[str] = []
         for p in paths:
-            if p.is_dir():
-                result.extend([q for q in p.rglob("*") if q.is_file()])
-            elif p.exists():
-                result.append(p)
-        return result
+            s = str(p)
+            if os.path.isdir(s) and not have_repo:
+                for dirpath, _dirnames, filenames in os.walk(s):
+                    result.extend(os.path.join(dirpath, name) for name in filenames)
+            elif os.path.isdir(s):
+                cmd = ["git", "ls-files", "-z", "--modified", "--others", "--exclude-standard", "--", s]
+                proc = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                if proc.returncode != 0:
+                    raise CommitterError(f"git ls-files failed with exit {proc.returncode}")
+                result.extend(os.path.join(root, os.fsdecode(rel)) for rel in proc.stdout.split(b"\x00") if rel)
+            elif os.path.exists(s):
+                result.append(s)
+        # Overlapping include paths may yield the same file twice; keep first-seen order
+        return [Path(s) for s in dict.fromkeys(result)]
 
     @staticmethod
-    def _git_add(repo_root: Path, paths: Iterable[Path]) -> None:
-        rels = [str(p.relative_to(repo_root)) for p in paths]
+    def _git_add(cwd: bytes, paths: Iterable[Path]) -> None:
+        root = os.fsdecode(cwd)
+        rels = [os.path.relpath(p, root) for p in paths]
         if not rels:
             return
-        cmd = ["git", "add"] + rels
         print(f"[Committer] git add {rels}")
-        subprocess.check_call(cmd, cwd=str(repo_root))
+        Committer._run_with_pathspec(cwd, ["git", "add"], rels)
 
     @staticmethod
-    def _git_reset(repo_root: Path, paths: Iterable[Path]) -> None:
-        rels = [str(p.relative_to(repo_root)) for p in paths]
+    def _git_reset(cwd: bytes, paths: Iterable[Path]) -> None:
+        root = os.fsdecode(cwd)
+        rels = [os.path.relpath(p, root) for p in paths]
         if not rels:
             return
-        cmd = ["git", "reset", "HEAD"] + rels
-        print(f"[Committer] git reset HEAD {' '.join(rels)}")
-        subprocess.check_call(cmd, cwd=str(repo_root))
+        print(f"[Committer] git reset {' '.join(rels)}")
+        Committer._run_with_pathspec(cwd, ["git", "reset"], rels)
 
     @staticmethod
-    def _git_commit(repo_root: Path, message: str) -> None:
+    def _run_with_pathspec(cwd: bytes, cmd: List[str], rels: List[str]) -> None:
+        # Paths go over stdin as NUL-separated pathspecs, so one git process
+        # handles any number of files without hitting the argv length limit.
+        cmd = cmd + ["--pathspec-from-file=-", "--pathspec-file-nul"]
+        data = b"\x00".join(os.fsencode(r) for r in rels)
+        subprocess.run(cmd, cwd=cwd, input=data, check=True)
+
+    @staticmethod
+    def _git_commit(cwd: bytes, message: str) -> None:
         cmd = ["git", "commit", "-m", message]
         print(f"[Committer] git commit -m {message!r}")
-        proc = subprocess.run(cmd, cwd=str(repo_root), text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        proc = subprocess.run(cmd, cwd=cwd, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         if proc.returncode != 0:
             print(proc.stdout)
             raise CommitterError(f"git commit failed with exit {proc.returncode}")
         print(proc.stdout)
 
     @staticmethod
-    def _git_init(repo_root: Path) -> None:
+    def _git_init(cwd: bytes) -> None:
         # Basic git init; branch name follows user's global/default config.
         cmd = ["git", "init"]
-        print(f"[Committer] git init (cwd={repo_root})")
-        proc = subprocess.run(cmd, cwd=str(repo_root), text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        print(f"[Committer] git init (cwd={os.fsdecode(cwd)})")
+        proc = subprocess.run(cmd, cwd=cwd, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         if proc.returncode != 0:
             print(proc.stdout)
             raise CommitterError(f"git init failed with exit {proc.returncode}")
         print(proc.stdout)
 
     @staticmethod
-    def _get_staged_paths(repo_root: Path) -> List[Path]:
-        cmd = ["git", "status", "--porcelain"]
-        proc = subprocess.run(cmd, cwd=str(repo_root), text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    def _get_staged_paths(cwd: bytes) -> List[Path]:
+        cmd = ["git", "status", "-z", "--porcelain=v1"]
+        # stderr kept separate so warnings cannot corrupt the NUL-delimited stdout
+        proc = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         if proc.returncode != 0:
             raise CommitterError(f"git status failed with exit {proc.returncode}")
+        root = os.fsdecode(cwd)
         paths: List[Path] = []
-        for line in proc.stdout.splitlines():
-            if not line:
-                continue
-            status = line[:2]
-            if status.strip() == "":
+        # -z gives "XY path" entries separated by NUL, with no quoting; renames
+        # and copies are followed by an extra entry holding the source path.
+        entries = iter(proc.stdout.split(b"\x00"))
+        for entry in entries:
+            if len(entry) < 4:
                 continue
+            status = entry[:2]
+            if status[:1] in (b"R", b"C"):
+                next(entries, None)
             # staged files have status in first column
-            if status[0] != " ":
-                rel = line[3:]
-                paths.append(repo_root / rel)
+            if status[:1] != b" ":
+                paths.append(Path(os.path.join(root, os.fsdecode(entry[3:]))))
         return paths
-
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Any
 
 
-@dataclass
+# No slots here: cached_property stores its values in the instance __dict__.
+@dataclass(frozen=True)
 class CreateCommandConfig:
     repo_root: Path
     project_name: str
@@ -15,33 +17,37 @@ class CreateCommandConfig:
     ollama_model: str
     dry_run: bool
 
-    @property
+    @cached_property
     def projects_root(self) -> Path:
         return self.repo_root / "projects"
 
-    @property
+    @cached_property
     def project_root(self) -> Path:
         return self.projects_root / self.project_name
 
-    @property
+    @cached_property
+    def project_root_str(self) -> str:
+        return str(self.project_root)
+
+    @cached_property
     def project_gitignore(self) -> Path:
         return self.project_root / ".gitignore"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlanFile:
     path: Path
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommitStep:
     name: str
     message: str
     include_paths: List[Path]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Plan:
     steps: List[str]
     files: List[PlanFile]
@@ -1,54 +1,209 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import time
-from dataclasses import dataclass
-from typing import Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+CACHE_DIR_ENV = "PROJECT_FACTORY_OLLAMA_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory for cached generations: $PROJECT_FACTORY_OLLAMA_CACHE_DIR if set,
+    otherwise ~/.cache/project_factory/ollama.
+    """
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env).expanduser()
+    return Path.home() / ".cache" / "project_factory" / "ollama"
 
 
 @dataclass
 class OllamaClient:
+    # generate_many worker count; matches the HTTPAdapter pool size so workers never wait on a connection
+    MAX_CONCURRENCY = 4
+    # Transient gateway/overload statuses worth retrying; anything else fails fast
+    RETRY_STATUSES = (502, 503, 504)
+
     base_url: str = "http://localhost:11434"
     timeout_seconds: int = 60
     max_retries: int = 3
     retry_backoff_seconds: float = 2.0
+    # Set to None to disable the on-disk generation cache
+    cache_dir: Optional[Path] = field(default_factory=default_cache_dir)
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False, compare=False)
+    _session_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Shared HTTP session so repeated calls reuse one keep-alive connection.
+
+        Retries happen in the transport: connection errors and RETRY_STATUSES
+        are retried with exponential backoff, up to max_retries attempts in
+        total.
+        """
+        if self._session is None:
+            # Double-checked so generate_many's workers build one session
+            with self._session_lock:
+                if self._session is None:
+                    # Imported lazily so dry runs and --help do not pay for loading requests
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util import Retry
+
+                    retry = Retry(
+                        total=max(self.max_retries - 1, 0),
+                        backoff_factor=self.retry_backoff_seconds,
+                        status_forcelist=self.RETRY_STATUSES,
+                        allowed_methods=frozenset({"POST"}),
+                        # Hand the final error response back so raise_for_status reports it
+                        raise_on_status=False,
+                    )
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.MAX_CONCURRENCY, pool_maxsize=self.MAX_CONCURRENCY, max_retries=retry
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers["Connection"] = "keep-alive"
+                    self._session = session
+        return self._session
+
+    def _url(self) -> str:
+        return f"{self.base_url.rstrip('/')}/api/generate"
+
+    def _cache_path(self, model: str, prompt: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(f"{model}\x00{prompt}".encode("utf8")).hexdigest()
+        return self.cache_dir / f"{key}.txt"
 
-    def generate(self, model: str, prompt: str) -> str:
+    @staticmethod
+    def _cache_read(path: Optional[Path]) -> Optional[str]:
+        if path is None:
+            return None
+        try:
+            return path.read_bytes().decode("utf8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _cache_write(path: Optional[Path], text: str) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial entry
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(text.encode("utf8"))
+            os.replace(tmp, path)
+        except OSError as exc:
+            print(f"[Ollama] Could not write generation cache {path} ({exc})")
+
+    def generate(self, model: str, prompt: str, force_refresh: bool = False) -> str:
         """
         Call Ollama's /api/generate endpoint with streaming disabled.
 
-        Raises requests.RequestException on repeated failures.
+        Results are cached on disk keyed by sha256(model, prompt); pass
+        force_refresh=True to bypass the cached entry.
+
+        Raises requests.RequestException once transport retries are exhausted
+        and ValueError on a malformed response (never retried).
         """
-        url = f"{self.base_url.rstrip('/')}/api/generate"
+        cache_path = self._cache_path(model, prompt)
+        if not force_refresh:
+            cached = self._cache_read(cache_path)
+            if cached is not None:
+                return cached
+        text = self._generate_uncached(model, prompt)
+        self._cache_write(cache_path, text)
+        return text
+
+    def _generate_uncached(self, model: str, prompt: str) -> str:
+        url = self._url()
         payload = {
             "model": model,
             "prompt": prompt,
             "stream": False,
         }
 
-        last_error: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                resp = requests.post(
-                    url,
-                    data=json.dumps(payload),
-                    headers={"Content-Type": "application/json"},
-                    timeout=self.timeout_seconds,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                # Ollama's non-streaming response usually has top-level "response"
+        resp = self.session.post(url, json=payload, timeout=self.timeout_seconds)
+        resp.raise_for_status()
+        try:
+            data = resp.json()
+        except ValueError as exc:
+            raise ValueError(f"Ollama returned invalid JSON: {exc}") from exc
+        # Ollama's non-streaming response usually has top-level "response"
+        text = data.get("response") if isinstance(data, dict) else None
+        if not isinstance(text, str):
+            raise ValueError(f"Unexpected Ollama response shape: {data!r}")
+        return text
+
+    def stream(self, model: str, prompt: str, force_refresh: bool = False) -> Iterator[str]:
+        """
+        Call Ollama's /api/generate endpoint with streaming enabled and yield
+        response fragments as they arrive.
+
+        Opening the connection is retried like generate(); once tokens have
+        been yielded, errors propagate to the caller. Shares generate()'s
+        cache: a cached entry is yielded whole, and a completed stream is
+        stored.
+        """
+        cache_path = self._cache_path(model, prompt)
+        if not force_refresh:
+            cached = self._cache_read(cache_path)
+            if cached is not None:
+                if cached:
+                    yield cached
+                return
+
+        url = self._url()
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+        }
+
+        resp = self.session.post(url, json=payload, timeout=self.timeout_seconds, stream=True)
+        parts: List[str] = []
+        done = False
+        with resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if "error" in data:
+                    raise ValueError(f"Ollama stream error: {data['error']!r}")
                 text = data.get("response")
                 if not isinstance(text, str):
                     raise ValueError(f"Unexpected Ollama response shape: {data!r}")
-                return text
-            except Exception as exc:  # noqa: BLE001 - want broad safety here
-                last_error = exc
-                if attempt >= self.max_retries:
+                if text:
+                    parts.append(text)
+                    yield text
+                if data.get("done"):
+                    done = True
                     break
-                time.sleep(self.retry_backoff_seconds)
-        assert last_error is not None
-        raise last_error
+        # Only cache complete generations, never a truncated stream
+        if done:
+            self._cache_write(cache_path, "".join(parts))
 
+    def generate_many(self, model: str, prompts: Sequence[str]) -> List[str]:
+        """
+        Run generate() for several prompts concurrently over the shared
+        session, returning results in prompt order. Ollama batches concurrent
+        requests server-side.
+        """
+        if len(prompts) <= 1:
+            return [self.generate(model=model, prompt=p) for p in prompts]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENCY, len(prompts))) as pool:
+            return list(pool.map(lambda p: self.generate(model=model, prompt=p), prompts))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -20,7 +21,11 @@ class Planner:
         if cfg.template != self.TEMPLATE_FASTAPI_BASIC:
             raise ValueError(f"Unsupported template: {cfg.template!r}")
 
-        project_root = cfg.project_root
+        root_s = cfg.project_root_str
+
+        def under_root(*parts: str) -> Path:
+            # os.path.join on a cached string avoids a PurePath join per segment
+            return Path(os.path.join(root_s, *parts))
 
         steps: List[str] = [
             "Create project directory under projects/<name>/",
@@ -33,14 +38,14 @@ class Planner:
         ]
 
         files: List[PlanFile] = [
-            PlanFile(project_root / "pyproject.toml", "Project metadata and dependencies for the FastAPI app"),
-            PlanFile(project_root / "README.md", "Project README customized based on the goal"),
-            PlanFile(project_root / "app" / "__init__.py", "Package marker"),
-            PlanFile(project_root / "app" / "main.py", "FastAPI application entrypoint with /health and /generate"),
-            PlanFile(project_root / "app" / "routers" / "__init__.py", "Package marker"),
-            PlanFile(project_root / "app" / "routers" / "health.py", "Health check router for /health"),
-            PlanFile(project_root / "tests" / "test_smoke.py", "Smoke test hitting /health endpoint"),
-            PlanFile(project_root / ".gitignore", "Per-project ignore rules (.venv, caches, data, model dumps)"),
+            PlanFile(under_root("pyproject.toml"), "Project metadata and dependencies for the FastAPI app"),
+            PlanFile(under_root("README.md"), "Project README customized based on the goal"),
+            PlanFile(under_root("app", "__init__.py"), "Package marker"),
+            PlanFile(under_root("app", "main.py"), "FastAPI application entrypoint with /health and /generate"),
+            PlanFile(under_root("app", "routers", "__init__.py"), "Package marker"),
+            PlanFile(under_root("app", "routers", "health.py"), "Health check router for /health"),
+            PlanFile(under_root("tests", "test_smoke.py"), "Smoke test hitting /health endpoint"),
+            PlanFile(under_root(".gitignore"), "Per-project ignore rules (.venv, caches, data, model dumps)"),
         ]
 
         # Commit plan: 3–4 commits
@@ -49,26 +54,26 @@ class Planner:
                 name="scaffold",
                 message=f"Scaffold FastAPI project {cfg.project_name}",
                 include_paths=[
-                    project_root / "pyproject.toml",
-                    project_root / "app",
-                    project_root / "tests",
-                    project_root / ".gitignore",
+                    under_root("pyproject.toml"),
+                    under_root("app"),
+                    under_root("tests"),
+                    under_root(".gitignore"),
                 ],
             ),
             CommitStep(
                 name="ai_customization",
                 message=f"Customize {cfg.project_name} AI behavior and endpoints",
                 include_paths=[
-                    project_root / "app" / "main.py",
-                    project_root / "README.md",
+                    under_root("app", "main.py"),
+                    under_root("README.md"),
                 ],
             ),
             CommitStep(
                 name="tests_and_docs",
                 message=f"Add tests and docs for {cfg.project_name}",
                 include_paths=[
-                    project_root / "tests",
-                    project_root / "README.md",
+                    under_root("tests"),
+                    under_root("README.md"),
                 ],
             ),
         ]
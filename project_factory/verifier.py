@@ -1,31 +1,111 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .config import CreateCommandConfig
 
+try:  # Python 3.11+
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - Python 3.10
+    tomllib = None  # type: ignore[assignment]
+
+
+VENV_CACHE_DIR_ENV = "PROJECT_FACTORY_VENV_CACHE_DIR"
+
+# Written last when populating a shared venv; its absence means a half-built venv.
+_VENV_COMPLETE_MARKER = ".project_factory_complete"
+
+
+def default_venv_cache_dir() -> Path:
+    """
+    Directory for shared verification venvs: $PROJECT_FACTORY_VENV_CACHE_DIR
+    if set, otherwise ~/.cache/project_factory/venvs.
+    """
+    env = os.environ.get(VENV_CACHE_DIR_ENV)
+    if env:
+        return Path(env).expanduser()
+    return Path.home() / ".cache" / "project_factory" / "venvs"
+
+
+_DEFAULT_TEMPLATES_ROOT = Path(__file__).resolve().parent / "templates"
+
 
 class VerifierError(RuntimeError):
     pass
 
 
 class Verifier:
-    def __init__(self) -> None:
-        ...
+    # Compile with all cores and skip the virtualenv and bytecode caches
+    COMPILEALL_ARGS: List[str] = ["-m", "compileall", "-j", "0", "-q", "-x", r"\.venv|__pycache__", "."]
+
+    # Builds the project's metadata without installing it, so packaging errors
+    # still fail verification on the shared-venv path
+    PACKAGING_CHECK_ARGS: List[str] = ["-m", "pip", "install", "--no-deps", "--dry-run", "--quiet", "."]
+
+    def __init__(
+        self,
+        venv_cache_dir: Optional[Path] = None,
+        share_venvs: bool = True,
+        templates_root: Path = _DEFAULT_TEMPLATES_ROOT,
+    ) -> None:
+        self.venv_cache_dir = venv_cache_dir if venv_cache_dir is not None else default_venv_cache_dir()
+        self.share_venvs = share_venvs
+        self.templates_root = templates_root
 
     def verify(self, cfg: CreateCommandConfig, dry_run: bool) -> None:
         """
         Create venv, install deps, run py_compile and pytest.
 
+        When the project's dependencies can be read, a shared venv keyed on
+        them is reused from the cache (see _shared_venv_dependencies);
+        otherwise a fresh per-project venv is created.
+
         Raises VerifierError on failure.
         """
         project_root = cfg.project_root
         venv_path = project_root / ".venv"
 
+        pyproject = project_root / "pyproject.toml"
+        if dry_run and not pyproject.is_file():
+            # Nothing has been rendered in a dry run; the template's pyproject is
+            # plain TOML with Jinja placeholders only inside strings.
+            pyproject = self.templates_root / cfg.template / "pyproject.toml.j2"
+        deps = self._shared_venv_dependencies(pyproject) if self.share_venvs else None
+        # An existing real .venv is left alone; a symlink is an earlier shared venv
+        if deps is not None and (venv_path.is_symlink() or not venv_path.exists()):
+            shared = self.venv_cache_dir / f"{cfg.template}-{self._venv_key(deps)}" / ".venv"
+            if dry_run:
+                venv_python = self._venv_python_executable(venv_path)
+                print("[Verifier/DRY_RUN] Would run verification commands:")
+                print(f" - ensure shared venv {shared} with {' '.join(deps)}")
+                print(f" - link {venv_path} -> {shared}")
+                print(f" - {venv_python} {' '.join(self.PACKAGING_CHECK_ARGS)} (cwd={project_root})")
+                print(f" - {venv_python} {' '.join(self.COMPILEALL_ARGS)} (cwd={project_root})")
+                print(f" - {venv_python} -m pytest -q {project_root}")
+                return
+            try:
+                self._ensure_shared_venv(shared, deps)
+                self._link_venv(shared, venv_path)
+            except OSError as exc:
+                print(f"[Verifier] Could not use shared venv ({exc}), creating a project venv instead.")
+            else:
+                # The project itself is not installed into the shared venv;
+                # `python -m pytest` from the project root imports it from cwd.
+                venv_python = self._venv_python_executable(venv_path)
+                print("[Verifier] Running tests with shared virtualenv...")
+                self._run([venv_python, *self.PACKAGING_CHECK_ARGS], cwd=project_root)
+                self._run([venv_python, *self.COMPILEALL_ARGS], cwd=project_root)
+                self._run([venv_python, "-m", "pytest", "-q"], cwd=project_root)
+                print("[Verifier] Verification succeeded.")
+                return
+
         commands: List[str] = []
 
         # venv creation (prefer uv)
@@ -40,7 +120,7 @@ class Verifier:
         commands.append(f"{venv_python} -m pip install -e {project_root}")
 
         # py_compile and pytest
-        commands.append(f"{venv_python} -m compileall {project_root}")
+        commands.append(f"{venv_python} {' '.join(self.COMPILEALL_ARGS)} (cwd={project_root})")
         commands.append(f"{venv_python} -m pytest -q {project_root}")
 
         if dry_run:
@@ -57,10 +137,113 @@ class Verifier:
 
         venv_python = self._venv_python_executable(venv_path)
         self._run([venv_python, "-m", "pip", "install", "-e", "."], cwd=project_root)
-        self._run([venv_python, "-m", "compileall", "."], cwd=project_root)
+        self._run([venv_python, *self.COMPILEALL_ARGS], cwd=project_root)
         self._run([venv_python, "-m", "pytest", "-q"], cwd=project_root)
         print("[Verifier] Verification succeeded.")
 
+    @staticmethod
+    def _shared_venv_dependencies(pyproject: Path) -> Optional[List[str]]:
+        """
+        Return the requirements a shared venv must contain, or None when
+        `pyproject` cannot be read (including on Python 3.10, where tomllib is
+        unavailable).
+
+        The list covers [project].dependencies plus the "dev" extra, so the
+        venv can run the tests without installing the project itself.
+        """
+        if tomllib is None:
+            return None
+        try:
+            with pyproject.open("rb") as f:
+                project = tomllib.load(f).get("project", {})
+        except (OSError, tomllib.TOMLDecodeError):
+            return None
+        deps = list(project.get("dependencies", []))
+        deps.extend(project.get("optional-dependencies", {}).get("dev", []))
+        return sorted(set(deps))
+
+    @staticmethod
+    def _venv_key(deps: List[str]) -> str:
+        # A venv is bound to its base interpreter, which is always sys.executable
+        # (see _ensure_shared_venv), so its path and version are part of the key.
+        blob = json.dumps(
+            {"deps": deps, "python": sys.executable, "version": sys.version, "platform": sys.platform}
+        ).encode("utf8")
+        return hashlib.sha256(blob).hexdigest()[:16]
+
+    def _ensure_shared_venv(self, shared: Path, deps: List[str]) -> None:
+        """
+        Make sure a fully populated venv exists at `shared`.
+
+        The venv is built in a private sibling directory and renamed into
+        place only once complete, so concurrent runs never see or delete each
+        other's half-built venvs. Console-script shebangs keep the temporary
+        path; verification only uses `python -m`, so that is harmless.
+        """
+        if (shared / _VENV_COMPLETE_MARKER).is_file():
+            print(f"[Verifier] Reusing shared virtualenv {shared}")
+            return
+        shared.parent.mkdir(parents=True, exist_ok=True)
+        building = shared.with_name(f"{shared.name}.tmp-{os.getpid()}")
+        if building.exists():
+            # Only this process uses this name; a leftover comes from a reused pid
+            shutil.rmtree(building)
+        print(f"[Verifier] Creating shared virtualenv {shared}")
+        try:
+            venv_python = self._venv_python_executable(building)
+            if self._have_command("uv"):
+                # Pin the interpreter; otherwise uv may pick one from PATH or .python-version
+                self._run(["uv", "venv", "--seed", "--python", sys.executable, str(building)], cwd=shared.parent)
+                if deps:
+                    self._run(["uv", "pip", "install", "--python", venv_python, *deps], cwd=shared.parent)
+            else:
+                self._run([sys.executable, "-m", "venv", str(building)], cwd=shared.parent)
+                if deps:
+                    self._run([venv_python, "-m", "pip", "install", *deps], cwd=shared.parent)
+            (building / _VENV_COMPLETE_MARKER).touch()
+            try:
+                os.replace(building, shared)
+            except OSError:
+                # Another run finished first; use its venv if it is complete
+                if not (shared / _VENV_COMPLETE_MARKER).is_file():
+                    self._replace_stale_venv(building, shared)
+        finally:
+            if building.exists():
+                shutil.rmtree(building, ignore_errors=True)
+
+    @staticmethod
+    def _replace_stale_venv(building: Path, shared: Path) -> None:
+        """
+        Swap the complete venv at `building` in for a marker-less one at `shared`.
+
+        Complete venvs are only ever renamed into place, so a directory there
+        without the marker was left by an older, non-atomic build and would
+        otherwise block this cache key for good. It is renamed aside first so
+        `shared` never holds a partially deleted tree.
+        """
+        stale = shared.with_name(f"{shared.name}.stale-{os.getpid()}")
+        if stale.exists():
+            # Only this process uses this name; a leftover comes from a reused pid
+            shutil.rmtree(stale)
+        print(f"[Verifier] Replacing incomplete shared virtualenv {shared}")
+        try:
+            os.replace(shared, stale)
+        except FileNotFoundError:
+            pass  # Another run moved it aside already
+        try:
+            os.replace(building, shared)
+        except OSError:
+            if not (shared / _VENV_COMPLETE_MARKER).is_file():
+                raise
+        finally:
+            shutil.rmtree(stale, ignore_errors=True)
+
+    @staticmethod
+    def _link_venv(shared: Path, venv_path: Path) -> None:
+        if venv_path.is_symlink():
+            venv_path.unlink()
+        os.symlink(shared, venv_path, target_is_directory=True)
+
     @staticmethod
     def _have_command(name: str) -> bool:
         from shutil import which
@@ -70,8 +253,8 @@ class Verifier:
     @staticmethod
     def _venv_python_executable(venv: Path) -> str:
         if os.name == "nt":
-            return str(venv / "Scripts" / "python.exe")
-        return str(venv / "bin" / "python")
+            return os.path.join(venv, "Scripts", "python.exe")
+        return os.path.join(venv, "bin", "python")
 
     @staticmethod
     def _run(cmd: List[str], cwd: Path) -> None:
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+pytest.importorskip("requests")
+
+from project_factory.ollama_client import OllamaClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls: List[str] = []
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _Handler.calls.append(body["prompt"])
+        if body["stream"]:
+            lines = [{"response": c, "done": False} for c in body["prompt"].upper()]
+            lines.append({"response": "", "done": True})
+            data = b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+        else:
+            data = json.dumps({"response": body["prompt"].upper()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    _Handler.calls = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_generate_many_returns_results_in_prompt_order(base_url: str) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=None)
+    prompts = [f"prompt {i}" for i in range(10)]
+
+    assert client.generate_many("m", prompts) == [p.upper() for p in prompts]
+    assert sorted(_Handler.calls) == sorted(prompts)
+
+
+def test_session_is_built_once_across_threads() -> None:
+    client = OllamaClient(cache_dir=None)
+    barrier = threading.Barrier(8)
+    sessions: List[object] = []
+
+    def grab() -> None:
+        barrier.wait()
+        sessions.append(client.session)
+
+    threads = [threading.Thread(target=grab) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(sessions) == 8
+    assert all(s is sessions[0] for s in sessions)
+
+
+def test_stream_yields_fragments(base_url: str) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=None)
+
+    assert "".join(client.stream("m", "abc")) == "ABC"
+
+
+def test_generate_cache_hit_and_miss(base_url: str, tmp_path: Path) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=tmp_path)
+
+    assert client.generate("m", "abc") == "ABC"
+    assert client.generate("m", "abc") == "ABC"
+    assert _Handler.calls == ["abc"]
+
+    # Model and prompt are both part of the key
+    client.generate("other", "abc")
+    client.generate("m", "abd")
+    assert _Handler.calls == ["abc", "abc", "abd"]
+
+
+def test_force_refresh_bypasses_and_rewrites_cache(base_url: str, tmp_path: Path) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=tmp_path)
+    cache_path = client._cache_path("m", "abc")
+    assert cache_path is not None
+    cache_path.write_text("stale", encoding="utf8")
+
+    assert client.generate("m", "abc") == "stale"
+    assert client.generate("m", "abc", force_refresh=True) == "ABC"
+    assert cache_path.read_text(encoding="utf8") == "ABC"
+    assert _Handler.calls == ["abc"]
+
+
+def test_stream_shares_the_generate_cache(base_url: str, tmp_path: Path) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=tmp_path)
+
+    assert "".join(client.stream("m", "abc")) == "ABC"
+    assert client.generate("m", "abc") == "ABC"
+    assert list(client.stream("m", "abc")) == ["ABC"]
+    assert _Handler.calls == ["abc"]
+
+
+def test_truncated_stream_is_not_cached(base_url: str, tmp_path: Path) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=tmp_path)
+
+    fragments = client.stream("m", "abc")
+    assert next(fragments) == "A"
+    fragments.close()
+
+    cache_path = client._cache_path("m", "abc")
+    assert cache_path is not None and not cache_path.exists()
+
+
+def test_cache_disabled(base_url: str) -> None:
+    client = OllamaClient(base_url=base_url, cache_dir=None)
+
+    client.generate("m", "abc")
+    client.generate("m", "abc")
+    assert _Handler.calls == ["abc", "abc"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from project_factory import verifier as verifier_mod
+from project_factory.config import CreateCommandConfig
+from project_factory.verifier import _VENV_COMPLETE_MARKER, Verifier
+
+pytestmark = pytest.mark.skipif(verifier_mod.tomllib is None, reason="shared venvs need tomllib")
+
+
+def _fake_run(cmd: List[str], cwd: Path) -> None:
+    # Stand-in for venv creation: materialize the target directory only
+    if "venv" in cmd:
+        venv = Path(cmd[-1])
+        (venv / "bin").mkdir(parents=True)
+        (venv / "bin" / "python").touch()
+
+
+@pytest.fixture
+def offline_verifier(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Verifier:
+    verifier = Verifier(venv_cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(Verifier, "_have_command", staticmethod(lambda name: False))
+    monkeypatch.setattr(Verifier, "_run", staticmethod(_fake_run))
+    return verifier
+
+
+def test_dry_run_reads_dependencies_from_template(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cfg = CreateCommandConfig(
+        repo_root=tmp_path,
+        project_name="demo",
+        goal="demo",
+        template="fastapi_basic",
+        ollama_model="m",
+        dry_run=True,
+    )
+
+    Verifier(venv_cache_dir=tmp_path / "cache").verify(cfg, dry_run=True)
+
+    out = capsys.readouterr().out
+    assert "ensure shared venv" in out
+    assert "fastapi>=0.110" in out
+    assert "pip install --no-deps --dry-run" in out
+
+
+def test_shared_venv_replaces_marker_less_directory(tmp_path: Path, offline_verifier: Verifier) -> None:
+    shared = tmp_path / "cache" / "fastapi_basic-0123" / ".venv"
+    (shared / "lib").mkdir(parents=True)
+    (shared / "lib" / "half-installed").touch()
+
+    offline_verifier._ensure_shared_venv(shared, ["pytest"])
+
+    assert (shared / _VENV_COMPLETE_MARKER).is_file()
+    assert not (shared / "lib").exists()
+    assert os.listdir(shared.parent) == [".venv"]
+
+
+def test_shared_venv_keeps_complete_directory(tmp_path: Path, offline_verifier: Verifier) -> None:
+    shared = tmp_path / "cache" / "fastapi_basic-0123" / ".venv"
+    shared.mkdir(parents=True)
+    (shared / _VENV_COMPLETE_MARKER).touch()
+    (shared / "keep").touch()
+
+    offline_verifier._ensure_shared_venv(shared, ["pytest"])
+
+    assert (shared / "keep").exists()